@@ -4,17 +4,23 @@ Usage: python ding-timer.py <seconds> [options]
 """
 
 import sys
-import csv
 import os
+import functools
 import time
-import math
 import argparse
 import subprocess
-import platform
-import threading
 from datetime import datetime
 
-LOG_FILE = os.path.expanduser("~/.ding-log.csv")
+if sys.platform.startswith("win"):
+    import winsound
+
+LOG_FILE = os.environ.get("DING_LOG_FILE") or os.path.expanduser("~/.ding-log.csv")
+LOG_HEADER = ["date", "task", "elapsed_seconds", "dings", "interval_seconds"]
+LOG_BUFFER_SIZE = 64 * 1024
+
+MILESTONE_LEVELS = frozenset((10, 50, 100, 500))
+# Summary labels, highest first
+ACHIEVEMENTS = ((500, "500th"), (100, "100th"), (50, "50th"), (10, "10th"))
 
 # ---------------------------------------------------------------------------
 # Color schemes
@@ -49,81 +55,195 @@ SCHEMES = {
 # ---------------------------------------------------------------------------
 # Sound
 # ---------------------------------------------------------------------------
+# sys.platform is a plain constant; platform.system() can shell out on first use.
+_SYSTEM = sys.platform
+
+# Ding levels in coalescing priority (session-complete beats any milestone,
+# bigger beats smaller). A level's position indexes the per-platform tuples.
+DING_LEVELS = (0, 10, 50, 100, 500, -1)
+_DING_INDEX = {level: i for i, level in enumerate(DING_LEVELS)}
+
+DARWIN_SOUNDS = (
+    "/System/Library/Sounds/Glass.aiff",
+    "/System/Library/Sounds/Ping.aiff",
+    "/System/Library/Sounds/Hero.aiff",
+    "/System/Library/Sounds/Funk.aiff",
+    "/System/Library/Sounds/Sosumi.aiff",
+    "/System/Library/Sounds/Hero.aiff",
+)
+
+LINUX_SOUNDS = (
+    "/usr/share/sounds/freedesktop/stereo/bell.oga",
+    "/usr/share/sounds/freedesktop/stereo/message.oga",
+    "/usr/share/sounds/freedesktop/stereo/complete.oga",
+    "/usr/share/sounds/freedesktop/stereo/service-login.oga",
+    "/usr/share/sounds/freedesktop/stereo/phone-incoming-call.oga",
+    "/usr/share/sounds/freedesktop/stereo/complete.oga",
+)
+
+# Windows: (frequency Hz, duration ms) for winsound.Beep
+WINDOWS_BEEPS = (
+    (1000, 200),
+    (1200, 250),
+    (1500, 300),
+    (2000, 400),
+    (2500, 600),
+    (2000, 600),
+)
+
+_ding_queue = None  # created with the worker thread (Windows only)
+_ding_worker_thread = None
+_player_commands = ()
+_devnull_fd = None
+_have_audio = None  # probed on the first audible ding
+
+
+def _build_player_commands():
+    """Resolve the player binary once and pre-build the argv for every level.
+
+    afplay/paplay play a single file and exit, so a process per ding is
+    unavoidable; resolving the absolute path up front at least spares exec
+    a $PATH walk each time. Returns () when the player or the default
+    sound is missing; a missing milestone sound falls back to the default.
+    """
+    if _SYSTEM.startswith("darwin"):
+        player, sounds = "afplay", DARWIN_SOUNDS
+    elif _SYSTEM.startswith("linux"):
+        player, sounds = "paplay", LINUX_SOUNDS
+    else:
+        return ()
+    import shutil
+
+    path = shutil.which(player)
+    if path is None or not os.path.exists(sounds[0]):
+        return ()
+    return tuple(
+        [path, sound if os.path.exists(sound) else sounds[0]] for sound in sounds
+    )
+
+
+def _play(index):
+    """Play the sound for DING_LEVELS[index].
+
+    Spawning a player returns immediately; winsound.Beep blocks for the
+    tone's duration, so it is only ever called from the ding worker.
+    """
+    try:
+        if _player_commands:
+            # Shared /dev/null fd instead of opens per spawn. Our own fds are
+            # non-inheritable (PEP 446), so the close_fds scan is skipped. A
+            # new session keeps Ctrl+C from cutting off the final ding.
+            subprocess.Popen(
+                _player_commands[index],
+                stdin=_devnull_fd, stdout=_devnull_fd, stderr=_devnull_fd,
+                close_fds=False, start_new_session=True,
+            )
+        elif _SYSTEM.startswith("win"):
+            winsound.Beep(*WINDOWS_BEEPS[index])
+    except Exception:
+        print("\a", end="", flush=True)
+
+
+def _ding_worker():
+    """Long-lived consumer of _ding_queue. Bursts collapse to the top-priority ding."""
+    import queue
+
+    while True:
+        index = _ding_queue.get()
+        while True:
+            try:
+                index = max(index, _ding_queue.get_nowait())
+            except queue.Empty:
+                break
+        _play(index)
+
+
+def init_audio():
+    """Probe the audio backend once. Idempotent; play_ding calls it lazily.
+
+    run_stopwatch calls it before the first ding so the probe (PATH search,
+    sound-file stats) doesn't delay that ding; importing stays cheap.
+    """
+    global _player_commands, _devnull_fd, _have_audio
+    if _have_audio is not None:
+        return
+    _player_commands = _build_player_commands()
+    _have_audio = bool(_player_commands) or _SYSTEM.startswith("win")
+    if _player_commands:
+        _devnull_fd = os.open(os.devnull, os.O_RDWR)
+
+
 def play_ding(milestone_level=0, quiet=False):
     """Play a system ding. milestone_level=-1 means session complete."""
+    global _ding_worker_thread, _ding_queue
     if quiet:
         return
 
-    def _play():
-        system = platform.system()
-        try:
-            if system == "Darwin":
-                sound_map = {
-                    0:    "/System/Library/Sounds/Glass.aiff",
-                    10:   "/System/Library/Sounds/Ping.aiff",
-                    50:   "/System/Library/Sounds/Hero.aiff",
-                    100:  "/System/Library/Sounds/Funk.aiff",
-                    500:  "/System/Library/Sounds/Sosumi.aiff",
-                    -1:   "/System/Library/Sounds/Hero.aiff",
-                }
-                subprocess.Popen(
-                    ["afplay", sound_map.get(milestone_level, sound_map[0])],
-                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-                )
-            elif system == "Linux":
-                sound_map = {
-                    0:    "/usr/share/sounds/freedesktop/stereo/bell.oga",
-                    10:   "/usr/share/sounds/freedesktop/stereo/message.oga",
-                    50:   "/usr/share/sounds/freedesktop/stereo/complete.oga",
-                    100:  "/usr/share/sounds/freedesktop/stereo/service-login.oga",
-                    500:  "/usr/share/sounds/freedesktop/stereo/phone-incoming-call.oga",
-                    -1:   "/usr/share/sounds/freedesktop/stereo/complete.oga",
-                }
-                subprocess.Popen(
-                    ["paplay", sound_map.get(milestone_level, sound_map[0])],
-                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-                )
-            elif system == "Windows":
-                import winsound
-                freq_map = {
-                    0:   (1000, 200),
-                    10:  (1200, 250),
-                    50:  (1500, 300),
-                    100: (2000, 400),
-                    500: (2500, 600),
-                    -1:  (2000, 600),
-                }
-                freq, dur = freq_map.get(milestone_level, freq_map[0])
-                winsound.Beep(freq, dur)
-        except Exception:
-            print("\a", end="", flush=True)
-
-    threading.Thread(target=_play, daemon=True).start()
+    if _have_audio is None:
+        init_audio()
+
+    # Headless / no player: the terminal bell is one byte, no thread needed.
+    if not _have_audio:
+        sys.stdout.write("\a")
+        sys.stdout.flush()
+        return
+
+    index = _DING_INDEX.get(milestone_level, 0)
+
+    # Popen doesn't block, so afplay/paplay are spawned straight from here.
+    if _player_commands:
+        _play(index)
+        return
+
+    if _ding_worker_thread is None:
+        import queue
+        import threading
+
+        _ding_queue = queue.SimpleQueue()
+        _ding_worker_thread = threading.Thread(target=_ding_worker, daemon=True)
+        _ding_worker_thread.start()
+    _ding_queue.put(index)
 
 
 # ---------------------------------------------------------------------------
 # Formatting helpers
 # ---------------------------------------------------------------------------
-def format_elapsed(seconds):
-    """HH:MM:SS.d or MM:SS.d"""
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = int(seconds % 60)
-    t = int((seconds % 1) * 10)
+# "00".."59" for the minute and second fields
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(60))
+
+
+def format_elapsed(seconds, tenths=True):
+    """HH:MM:SS.d or MM:SS.d (HH:MM:SS or MM:SS with tenths=False)."""
+    if not tenths:
+        m, sec = divmod(int(seconds), 60)
+        h, m = divmod(m, 60)
+        if h > 0:
+            return f"{h:02d}:{_TWO_DIGITS[m]}:{_TWO_DIGITS[sec]}"
+        return f"{_TWO_DIGITS[m]}:{_TWO_DIGITS[sec]}"
+    rest, t = divmod(int(seconds * 10), 10)
+    m, sec = divmod(rest, 60)
+    h, m = divmod(m, 60)
     if h > 0:
-        return f"{h:02d}:{m:02d}:{s:02d}.{t}"
-    return f"{m:02d}:{s:02d}.{t}"
+        return f"{h:02d}:{_TWO_DIGITS[m]}:{_TWO_DIGITS[sec]}.{t}"
+    return f"{_TWO_DIGITS[m]}:{_TWO_DIGITS[sec]}.{t}"
 
 
-def format_remaining(seconds):
-    """H:MM:SS or MM:SS (no suffix — caller adds it)."""
-    seconds = max(0.0, seconds)
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = int(seconds % 60)
+@functools.lru_cache(maxsize=1)
+def _format_whole_seconds(whole):
+    m, sec = divmod(whole, 60)
+    h, m = divmod(m, 60)
     if h > 0:
-        return f"{h}:{m:02d}:{s:02d}"
-    return f"{m:02d}:{s:02d}"
+        return f"{h}:{_TWO_DIGITS[m]}:{_TWO_DIGITS[sec]}"
+    return f"{_TWO_DIGITS[m]}:{_TWO_DIGITS[sec]}"
+
+
+def format_remaining(seconds):
+    """H:MM:SS or MM:SS (no suffix — caller adds it).
+
+    Only whole seconds are shown, so consecutive frames within the same
+    second hit the one-entry cache instead of reformatting.
+    """
+    return _format_whole_seconds(int(max(0.0, seconds)))
 
 
 def parse_duration(s):
@@ -138,6 +258,35 @@ def parse_duration(s):
     return float(s)
 
 
+def _write_all(fd, data):
+    """os.write() all of data; a busy tty or pipe may take only part of it."""
+    n = os.write(fd, data)
+    if n < len(data):
+        data = memoryview(data)[n:]
+        while data:
+            data = data[os.write(fd, data):]
+
+
+def write_block(text):
+    """Write a multi-line block to stdout as a single write(2) where possible.
+
+    Anything already buffered in sys.stdout is flushed first so ordering
+    holds. Windows consoles and streams without a real fd (e.g. StringIO)
+    take the ordinary text path.
+    """
+    out = sys.stdout
+    out.flush()
+    try:
+        fd = out.fileno()
+    except (AttributeError, OSError, ValueError):
+        fd = None
+    if fd is None or sys.platform == "win32":
+        out.write(text)
+        out.flush()
+        return
+    _write_all(fd, text.encode(out.encoding or "utf-8", "replace"))
+
+
 # ---------------------------------------------------------------------------
 # Progress bar
 # ---------------------------------------------------------------------------
@@ -148,46 +297,70 @@ def build_bar(s, progress, reverse=False):
     Gradient color is keyed on the display fill level so it signals urgency
     correctly in both directions.
     """
+    return s["bar"](progress, reverse)
+
+
+def make_bar(s):
+    """Return a bar(progress, reverse=False) -> str closure for scheme s.
+
+    The scheme's width and pre-rendered bar tables are bound as locals so
+    the per-frame call does no dict lookups.
+    """
     bar_width = s["bar_width"]
-    display = max(0.0, min(1.0, (1.0 - progress) if reverse else progress))
-    filled = int(bar_width * display)
+    tiers = s["bars"]
+    # (coral, yellow, green); non-gradient schemes reuse one table throughout
+    if len(tiers) == 1:
+        tiers *= 3
 
-    if not s["reset"]:
-        return s["filled"] * filled + s["empty"] * (bar_width - filled)
+    def bar(progress, reverse=False):
+        display = max(0.0, min(1.0, (1.0 - progress) if reverse else progress))
+        # Urgency tier: 0 at <=10% fill, 1 at <=30%, 2 above
+        return tiers[(display > 0.3) + (display > 0.1)][int(bar_width * display)]
+
+    return bar
 
-    if s["gradient"]:
-        if display > 0.3:
-            color = s["green"]
-        elif display > 0.1:
-            color = s["yellow"]
-        else:
-            color = s["coral"]
-    else:
-        color = s["blue"]
 
-    return (
-        f"{color}{s['filled'] * filled}"
-        f"{s['dim']}{s['empty'] * (bar_width - filled)}{s['reset']}"
+def _prerender_bars(s):
+    """Every fill state (0..bar_width) for each bar colour the scheme uses.
+
+    Returns one tuple per colour, indexed by filled-cell count: coral,
+    yellow, green for gradient schemes, otherwise a single entry.
+    """
+    w = s["bar_width"]
+    runs = [(s["filled"] * f, s["empty"] * (w - f)) for f in range(w + 1)]
+    if not s["reset"]:
+        return (tuple(a + b for a, b in runs),)
+    colors = (s["coral"], s["yellow"], s["green"]) if s["gradient"] else (s["blue"],)
+    return tuple(
+        tuple(f"{c}{a}{s['dim']}{b}{s['reset']}" for a, b in runs) for c in colors
     )
 
 
+# Bars are looked up, not built, per frame; build_bar reuses one closure
+for _s in SCHEMES.values():
+    _s["bars"] = _prerender_bars(_s)
+    _s["bar"] = make_bar(_s)
+del _s
+
+
 # ---------------------------------------------------------------------------
 # Header
 # ---------------------------------------------------------------------------
-def print_header(interval, task, duration, s, cs):
-    """Print the session start header. cs = color_scheme key."""
+def render_header(interval, task, duration, s, cs):
+    """Return the session start header as one string. cs = color_scheme key."""
     interval_str = f"{interval:g}s"
     task_str = f" - {task}" if task else ""
 
     if cs == "b":
         dur_part = f" | Duration: {format_remaining(duration)}" if duration else ""
-        print(
+        lines = [
             f"\n{s['dim']}Interval: {interval_str}{task_str}{dur_part}"
             f" • Ctrl+C to stop{s['reset']}\n"
-        )
+        ]
 
     elif cs == "c":
         bw = 44
+        rule = "─" * (bw - 2)
         parts = [f"Interval: {interval_str}"]
         if duration:
             parts.append(f"Duration: {format_remaining(duration)}")
@@ -196,174 +369,236 @@ def print_header(interval, task, duration, s, cs):
         content = "  ".join(parts)
         hint = "(Ctrl+C to stop)"
         pad = max(0, bw - 2 - 1 - len(content) - 2 - len(hint) - 1)
-        print(f"\n{s['cyan']}┌{'─' * (bw - 2)}┐{s['reset']}")
-        print(
+        lines = [
+            f"\n{s['cyan']}┌{rule}┐{s['reset']}",
             f"{s['cyan']}│{s['reset']} "
             f"{s['yellow']}{content}{s['reset']}  "
             f"{s['dim']}{hint}{s['reset']}"
-            f"{' ' * pad}{s['cyan']}│{s['reset']}"
-        )
-        print(f"{s['cyan']}└{'─' * (bw - 2)}┘{s['reset']}\n")
+            f"{' ' * pad}{s['cyan']}│{s['reset']}",
+            f"{s['cyan']}└{rule}┘{s['reset']}\n",
+        ]
 
     elif cs == "a":
         dur_part = (
             f" {s['dim']}|{s['reset']} {s['green']}{format_remaining(duration)}{s['reset']}"
             if duration else ""
         )
-        print(
+        lines = [
             f"\n{s['cyan']}⏱️  Stopwatch{s['reset']} {s['dim']}•{s['reset']} "
             f"Ding every {s['yellow']}{interval_str}{s['reset']}{task_str}"
             f"{dur_part} {s['dim']}• Ctrl+C to stop{s['reset']}\n"
-        )
+        ]
 
     else:
         hw = 52
+        rule = "═" * hw
         mode = "COUNTDOWN" if duration else "STOPWATCH"
-        print(f"\n{'═' * hw}")
-        print(f"{'⏱️  ' + mode:^{hw}}")
-        print(f"{'Ding every ' + interval_str:^{hw}}")
+        lines = [
+            f"\n{rule}",
+            f"{'⏱️  ' + mode:^{hw}}",
+            f"{'Ding every ' + interval_str:^{hw}}",
+        ]
         if duration:
-            print(f"{'Duration: ' + format_remaining(duration):^{hw}}")
-        print("═" * hw)
+            lines.append(f"{'Duration: ' + format_remaining(duration):^{hw}}")
+        lines.append(rule)
         if task:
-            print(f"{'Task: ' + task:^{hw}}")
-            print("─" * hw)
-        print(f"\n{'Press Ctrl+C to stop':^{hw}}\n")
+            lines.append(f"{'Task: ' + task:^{hw}}")
+            lines.append("─" * hw)
+        lines.append(f"\n{'Press Ctrl+C to stop':^{hw}}\n")
+
+    return "\n".join(lines) + "\n"
+
+
+def print_header(interval, task, duration, s, cs):
+    """Print the session start header in a single write."""
+    write_block(render_header(interval, task, duration, s, cs))
 
 
 # ---------------------------------------------------------------------------
 # Live display line
 # ---------------------------------------------------------------------------
-def render_line(elapsed, interval, last_ding, ding_flash_until,
-                duration, reverse, max_dings, s, cs):
-    """Return the overwriting status line string."""
-
-    # --- Time display ---
-    if duration:
-        time_str = format_remaining(duration - elapsed) + " left"
+def make_render_line(interval, duration, reverse, max_dings, s, cs, tenths=True):
+    """Return a render(elapsed, last_ding, ding_flash_until) -> str closure.
+
+    Scheme, mode and limits are fixed for a session, so every colour code
+    and layout branch is folded into two %-templates here; each frame does
+    one format for the indicator and one for the whole line. Both times
+    are session seconds from the monotonic start. tenths=False drops the
+    .d field from the stopwatch time (for slow frame rates).
+    """
+    if cs:
+        time_fmt = f"{s['cyan']}%s{s['reset']}"
+        flash = f"{s['magenta']}🔔 DING!{s['reset']}"
+        next_fmt = f"{s['yellow']}Next: %3ds{s['reset']}"
+        count_fmt = f" {s['dim']}[%d/{max_dings}]{s['reset']}"
+        clock_fmt = f"{s['dim']}[%s]{s['reset']}"
     else:
-        time_str = format_elapsed(elapsed)
-
-    # --- Progress bar ---
+        time_fmt = "%s"
+        flash = "🔔 DING!"
+        next_fmt = "Next: %3ds"
+        count_fmt = f" [%d/{max_dings}]"
+        clock_fmt = "[%s]"
+    if max_dings:
+        next_fmt += count_fmt
+    bar_for = make_bar(s)
+    fmt_elapsed = format_elapsed if tenths else functools.partial(format_elapsed, tenths=False)
     if duration:
-        # Session-level reverse bar: starts full, drains to zero at end
-        bar = build_bar(s, min(1.0, elapsed / duration), reverse=True)
-    else:
-        # Interval-level bar (forward by default, reverse with --reverse)
-        bar = build_bar(s, (elapsed % interval) / interval, reverse=reverse)
+        time_fmt = time_fmt.replace("%s", "%s left")
 
-    # --- Ding indicator ---
-    secs_to_next = math.ceil((last_ding + 1) * interval - elapsed)
-    if time.time() < ding_flash_until:
-        ding_part = f"{s['magenta']}🔔 DING!{s['reset']}" if cs else "🔔 DING!"
+    # Clear leftovers from a longer previous frame: erase-to-end-of-line on
+    # ANSI schemes, trailing spaces on the escape-free plain scheme.
+    tail = "\033[K" if cs else "   "
+    if cs == "b":
+        line_fmt = f"\r{time_fmt} %s %s  {clock_fmt}{tail}"
     else:
-        if cs:
-            count_info = f" {s['dim']}[{last_ding}/{max_dings}]{s['reset']}" if max_dings else ""
-            ding_part = f"{s['yellow']}Next: {secs_to_next:3d}s{s['reset']}{count_info}"
+        line_fmt = f"\r  ┃ {time_fmt} ┃ [%s] %-25s{clock_fmt}{tail}"
+
+    # Wall clock only shows HH:MM: reformat once per minute, not per frame
+    clock_minute = None
+    clock_str = ""
+    # "Next: Ns [n/max]" only changes once a second or on a ding
+    next_key = None
+    next_str = ""
+
+    def render(elapsed, last_ding, ding_flash_until):
+        nonlocal clock_minute, clock_str, next_key, next_str
+        # --- Time display + progress bar ---
+        if duration:
+            # Round remaining time up, like "Next:": frames land just after
+            # each second, and flooring there would skip a value at 1 fps.
+            time_str = format_remaining(-((elapsed - duration) // 1))
+            # Session-level reverse bar: starts full, drains to zero at end
+            bar = bar_for(min(1.0, elapsed / duration), reverse=True)
         else:
-            count_info = f" [{last_ding}/{max_dings}]" if max_dings else ""
-            ding_part = f"Next: {secs_to_next:3d}s{count_info}"
+            time_str = fmt_elapsed(elapsed)
+            # Interval-level bar (forward by default, reverse with --reverse)
+            bar = bar_for((elapsed % interval) / interval, reverse=reverse)
 
-    # --- Wall clock ---
-    clock_str = datetime.now().strftime("%H:%M")
-    clock = f"{s['dim']}[{clock_str}]{s['reset']}" if cs else f"[{clock_str}]"
+        # --- Ding indicator ---
+        if elapsed < ding_flash_until:
+            ding_part = flash
+        else:
+            # Whole seconds to the next ding, rounded up: -floor(-x) == ceil(x)
+            key = (-int((elapsed - (last_ding + 1) * interval) // 1), last_ding)
+            if key != next_key:
+                next_key = key
+                next_str = next_fmt % (key if max_dings else key[0])
+            ding_part = next_str
 
-    # --- Compose ---
-    colored_time = f"{s['cyan']}{time_str}{s['reset']}" if cs else time_str
-    if cs == "b":
-        return f"\r{colored_time} {bar} {ding_part}  {clock}   "
-    return f"\r  ┃ {colored_time} ┃ [{bar}] {ding_part:<25}{clock}   "
+        # --- Wall clock ---
+        minute = int(time.time() // 60)
+        if minute != clock_minute:
+            clock_minute = minute
+            clock_str = datetime.now().strftime("%H:%M")
+
+        return line_fmt % (time_str, bar, ding_part, clock_str)
+
+    return render
 
 
 # ---------------------------------------------------------------------------
 # Summary
 # ---------------------------------------------------------------------------
-def print_summary(elapsed, last_ding, achieved, s, cs, session_complete=False):
-    """Print end-of-session summary. Call after the live loop ends."""
-    print()  # newline to end the live display line
+def print_summary(elapsed, last_ding, achieved, s, cs, session_complete=False, skipped=0):
+    """Print end-of-session summary in a single write. Call after the live loop ends.
+
+    skipped = dings that were counted but coalesced into a later one.
+    """
+    lines = [""]  # newline to end the live display line
 
     if session_complete:
         msg = (
             f"{s['green']}✅ Session complete!{s['reset']}" if cs
             else "✅ Session complete!"
         )
-        print(f"\n{msg}")
+        lines.append(f"\n{msg}")
+
+    if skipped:
+        lines.append(f"\n{s['dim']}({skipped} overdue dings were coalesced){s['reset']}")
 
     elapsed_str = format_elapsed(elapsed)
     avg_str = f"{elapsed / last_ding:.1f}s" if last_ding > 0 else "—"
+    achieved_str = ", ".join(achieved)
 
     if cs == "b":
-        print(
+        lines.append(
             f"\n{s['dim']}Final:{s['reset']} "
             f"{s['green']}{elapsed_str}{s['reset']} "
             f"{s['dim']}│{s['reset']} "
             f"{s['pink']}{last_ding}{s['reset']} dings"
         )
         if last_ding > 0:
-            print(f"{s['dim']}Avg: {avg_str}{s['reset']}")
+            lines.append(f"{s['dim']}Avg: {avg_str}{s['reset']}")
         if achieved:
-            print(f"{s['dim']}Achieved: {s['pink']}{', '.join(achieved)}{s['reset']}")
-        print()
+            lines.append(f"{s['dim']}Achieved: {s['pink']}{achieved_str}{s['reset']}")
+        lines.append("")
 
     elif cs == "c":
         bw = 40
+        rule = "─" * (bw - 2)
         rows = [("Time:", elapsed_str, s["green"])]
         rows.append(("Dings:", str(last_ding), s["magenta"]))
         if last_ding > 0:
             rows.append(("Average:", avg_str, s["yellow"]))
         if achieved:
-            rows.append(("Achieved:", ", ".join(achieved), s["magenta"]))
-        print(f"\n{s['cyan']}┌{'─' * (bw - 2)}┐{s['reset']}")
+            rows.append(("Achieved:", achieved_str, s["magenta"]))
+        lines.append(f"\n{s['cyan']}┌{rule}┐{s['reset']}")
         for label, value, color in rows:
             pad = max(0, bw - 2 - 1 - len(label) - 1 - len(value) - 1)
-            print(
+            lines.append(
                 f"{s['cyan']}│{s['reset']} "
                 f"{s['dim']}{label}{s['reset']} "
                 f"{color}{value}{s['reset']}"
                 f"{' ' * pad}{s['cyan']}│{s['reset']}"
             )
-        print(f"{s['cyan']}└{'─' * (bw - 2)}┘{s['reset']}\n")
+        lines.append(f"{s['cyan']}└{rule}┘{s['reset']}\n")
 
     else:
         hw = 52
-        print(f"\n{s['cyan']}{'─' * hw}{s['reset']}")
-        print(f"{s['cyan']}{'⏹️  STOPPED':^{hw}}{s['reset']}")
-        print(f"{s['cyan']}{'─' * hw}{s['reset']}")
+        rule = f"{s['cyan']}{'─' * hw}{s['reset']}"
+        lines.append(f"\n{rule}")
+        lines.append(f"{s['cyan']}{'⏹️  STOPPED':^{hw}}{s['reset']}")
+        lines.append(rule)
         if cs:
-            print(f"\n  {s['dim']}Final time:{s['reset']} {s['green']}{elapsed_str}{s['reset']}")
-            print(f"  {s['dim']}Total dings:{s['reset']} {s['magenta']}{last_ding}{s['reset']}")
+            lines.append(f"\n  {s['dim']}Final time:{s['reset']} {s['green']}{elapsed_str}{s['reset']}")
+            lines.append(f"  {s['dim']}Total dings:{s['reset']} {s['magenta']}{last_ding}{s['reset']}")
             if last_ding > 0:
-                print(f"  {s['dim']}Average interval:{s['reset']} {s['yellow']}{avg_str}{s['reset']}")
+                lines.append(f"  {s['dim']}Average interval:{s['reset']} {s['yellow']}{avg_str}{s['reset']}")
             if achieved:
-                print(f"  {s['dim']}Achieved:{s['reset']} {s['magenta']}{', '.join(achieved)}{s['reset']}")
+                lines.append(f"  {s['dim']}Achieved:{s['reset']} {s['magenta']}{achieved_str}{s['reset']}")
         else:
-            print(f"\n  Final time: {elapsed_str}")
-            print(f"  Total dings: {last_ding}")
+            lines.append(f"\n  Final time: {elapsed_str}")
+            lines.append(f"  Total dings: {last_ding}")
             if last_ding > 0:
-                print(f"  Average interval: {avg_str}")
+                lines.append(f"  Average interval: {avg_str}")
             if achieved:
-                print(f"  Achieved: {', '.join(achieved)}")
-        print()
+                lines.append(f"  Achieved: {achieved_str}")
+        lines.append("")
+
+    write_block("\n".join(lines) + "\n")
 
 
 # ---------------------------------------------------------------------------
 # Log
 # ---------------------------------------------------------------------------
 def save_log(task, elapsed, last_ding, interval):
-    """Silently append session record to ~/.ding-log.csv."""
+    """Silently append session record to LOG_FILE (~/.ding-log.csv by default)."""
+    import csv  # only needed once, at exit
+
+    row = [
+        datetime.now().strftime("%Y-%m-%d %H:%M"),
+        task or "",
+        f"{elapsed:.1f}",
+        last_ding,
+        f"{interval:g}",
+    ]
     try:
-        exists = os.path.exists(LOG_FILE)
-        with open(LOG_FILE, "a", newline="") as f:
-            w = csv.writer(f)
-            if not exists:
-                w.writerow(["date", "task", "elapsed_seconds", "dings", "interval_seconds"])
-            w.writerow([
-                datetime.now().strftime("%Y-%m-%d %H:%M"),
-                task or "",
-                f"{elapsed:.1f}",
-                last_ding,
-                f"{interval:g}",
-            ])
+        # Block-buffered; rows reach the file in one write when the handle closes.
+        with open(LOG_FILE, "a", newline="", buffering=LOG_BUFFER_SIZE) as f:
+            # Append mode opens at EOF, so offset 0 means a new (or empty)
+            # file -- no separate stat needed to decide on the header.
+            rows = [LOG_HEADER, row] if f.tell() == 0 else [row]
+            csv.writer(f).writerows(rows)
     except Exception:
         pass
 
@@ -371,24 +606,88 @@ def save_log(task, elapsed, last_ding, interval):
 # ---------------------------------------------------------------------------
 # Main loop
 # ---------------------------------------------------------------------------
+def render_period(interval, duration, bar_width):
+    """Seconds between display frames: no faster than the display can change.
+
+    Stopwatch shows tenths, so it runs at 10 fps unless the interval is a
+    minute or more (tenths are then dropped). Countdown shows whole seconds
+    and slows down with the interval, but still frames often enough for the
+    session bar to move one cell at a time.
+    """
+    if duration:
+        period = 0.1 if interval < 5 else 0.5 if interval < 60 else 1.0
+        return max(0.1, min(period, duration / bar_width))
+    return 1.0 if interval >= 60 else 0.1
+
+
+def highest_milestone(first, last):
+    """Largest milestone level in [first, last], or 0 if none."""
+    return max((m for m in MILESTONE_LEVELS if first <= m <= last), default=0)
+
+
 def run_stopwatch(interval, milestones=False, task=None, color_scheme=None,
-                  quiet=False, duration=None, max_dings=None, reverse=False):
+                  quiet=False, duration=None, max_dings=None, reverse=False,
+                  clock=time.monotonic, sleep=time.sleep):
+    # clock/sleep are injectable so tests can drive a session without real
+    # time passing; sleep(seconds) may raise KeyboardInterrupt to stop it.
     s = SCHEMES.get(color_scheme, SCHEMES[None])
 
     # Reverse bar is default for countdown mode
     if duration and not reverse:
         reverse = True
 
-    start_time = time.time()
+    # Monotonic clock: immune to NTP/wall-clock jumps mid-session
+    start_time = clock()
+    frame_period = render_period(interval, duration, s["bar_width"])
+    next_frame = 0  # index of the next display frame
     last_ding = 0
+    skipped = 0
+    next_ding_at = interval  # seconds since start of the next ding boundary
     ding_flash_until = 0.0
     session_complete = False
+    last_line = None
+    last_render = float("-inf")
+    min_redraw = 1 / 15  # cap repaints at ~15 fps even with extra ding/flash wakes
 
     print_header(interval, task, duration, s, color_scheme)
+    if not quiet:
+        init_audio()
+
+    # Loop invariants bound as locals: no global/attribute lookups for the
+    # output path, clock or renderer.
+    sys.stdout.flush()  # header must land before any raw fd/buffer writes
+    encoding = sys.stdout.encoding or "utf-8"
+    if sys.platform != "win32" and sys.stdout.isatty():
+        # One write(2) per frame, bypassing TextIOWrapper encoding and locking
+        fd = sys.stdout.fileno()
+        write_all = _write_all
+
+        def emit(line):
+            write_all(fd, line.encode(encoding, "replace"))
+    elif hasattr(sys.stdout, "buffer"):
+        # Pipes/files/Windows console: pre-encode and go straight to the
+        # binary buffer. Frames end in no newline, so flush explicitly.
+        write = sys.stdout.buffer.write
+        flush = sys.stdout.buffer.flush
+
+        def emit(line):
+            write(line.encode(encoding, "replace"))
+            flush()
+    else:
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+
+        def emit(line):
+            write(line)
+            flush()
+    render = make_render_line(
+        interval, duration, reverse, max_dings, s, color_scheme,
+        tenths=frame_period < 1.0,
+    )
 
     try:
         while True:
-            elapsed = time.time() - start_time
+            elapsed = clock() - start_time
 
             # Auto-stop: duration elapsed
             if duration and elapsed >= duration:
@@ -403,32 +702,60 @@ def run_stopwatch(interval, milestones=False, task=None, color_scheme=None,
                 break
 
             # Interval ding check
-            current_interval = int(elapsed // interval)
-            if current_interval > last_ding:
-                last_ding = current_interval
-                milestone = last_ding if (milestones and last_ding in {10, 50, 100, 500}) else 0
+            if elapsed >= next_ding_at:
+                # After a stall (suspend, SIGSTOP) several boundaries may have
+                # passed: play one ding for the lot, keeping the best milestone.
+                # Floor division can fall one short of the boundary just
+                # crossed (0.5 // 0.1 == 4.0), so always move forward.
+                current = max(last_ding + 1, int(elapsed // interval))
+                skipped += current - last_ding - 1
+                milestone = highest_milestone(last_ding + 1, current) if milestones else 0
+                last_ding = current
+                next_ding_at = (last_ding + 1) * interval
                 play_ding(milestone, quiet=quiet)
-                ding_flash_until = time.time() + 0.5  # time-based flash
-
-            line = render_line(
-                elapsed, interval, last_ding, ding_flash_until,
-                duration, reverse, max_dings, s, color_scheme,
-            )
-            print(line, end="", flush=True)
-            time.sleep(0.1)
+                ding_flash_until = elapsed + 0.5  # time-based flash
+
+            # Countdown/clock text often repeats between ticks; only repaint on
+            # change, and never faster than min_redraw (a skipped change is
+            # picked up by the next frame).
+            redraw_at = last_render + min_redraw
+            if elapsed >= redraw_at:
+                line = render(elapsed, last_ding, ding_flash_until)
+                if line != last_line:
+                    emit(line)
+                    last_line = line
+                    last_render = elapsed
+
+            # Wake at whichever absolute target comes first: the next frame,
+            # the next ding boundary, the end of the DING! flash, or the end of
+            # the session. Frame targets are start + n*period, so loop overhead
+            # never accumulates as drift, and if we fell behind (e.g. suspend)
+            # we resync instead of racing.
+            now = clock() - start_time
+            if next_frame * frame_period <= now:
+                next_frame = int(now / frame_period) + 1
+                # int(4.3 / 0.1) == 42: float error can leave the target at
+                # or before now, which would skip the wait and spin.
+                while next_frame * frame_period <= now:
+                    next_frame += 1
+            wake_at = min(next_frame * frame_period, next_ding_at)
+            if now < ding_flash_until < wake_at:
+                wake_at = ding_flash_until
+            if now < redraw_at < wake_at:
+                wake_at = redraw_at  # a repaint was deferred by the fps cap
+            if duration:
+                wake_at = min(wake_at, duration)
+            if wake_at > now:
+                sleep(wake_at - now)  # time.sleep: Ctrl+C still lands at once
 
     except KeyboardInterrupt:
         pass
 
-    elapsed = time.time() - start_time
+    elapsed = clock() - start_time
 
-    achieved = []
-    if milestones:
-        for m in [500, 100, 50, 10]:
-            if last_ding >= m:
-                achieved.append(f"{m}th")
+    achieved = [label for m, label in ACHIEVEMENTS if last_ding >= m] if milestones else []
 
-    print_summary(elapsed, last_ding, achieved, s, color_scheme, session_complete)
+    print_summary(elapsed, last_ding, achieved, s, color_scheme, session_complete, skipped)
     save_log(task, elapsed, last_ding, interval)
 
 
@@ -2,124 +2,265 @@
 """Standalone test suite for ding-timer.py
 
 Run with:  python test_ding_timer.py
+    or:    pytest -n auto test_ding_timer.py   (tests are independent)
 """
 
 import os
 import sys
+import contextlib
 import csv
+import importlib.util
+import io
+import re
 import signal
+import selectors
 import time
 import subprocess
 import tempfile
 import unittest
+from unittest import mock
 
 SCRIPT = os.path.join(os.path.dirname(__file__), "ding-timer.py")
 
-
-def run(args, wait=1.5, timeout=10):
-    """Launch ding-timer with args, let it run for `wait` seconds, then interrupt.
-
-    Uses SIGINT (not SIGTERM) so the KeyboardInterrupt handler fires and the
-    summary is printed before the process exits.
+# Loaded once and shared by the in-process tests; they only call pure helpers.
+_spec = importlib.util.spec_from_file_location("ding_timer", SCRIPT)
+DING = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(DING)
+
+# Children log to /dev/null unless a test asks otherwise, so running the
+# suite never touches the real ~/.ding-log.csv. The script only needs the
+# stdlib: skip the user site scan, and leave __pycache__ to this process.
+CHILD_ENV = dict(
+    os.environ,
+    DING_LOG_FILE=os.devnull,
+    PYTHONDONTWRITEBYTECODE="1",
+    PYTHONNOUSERSITE="1",
+)
+
+
+def run(args, wait=1.5, timeout=10, until=b"Next:"):
+    """Launch ding-timer with args, wait for the first display line, then interrupt.
+
+    Polls stdout until `until` shows up (every mode prints "Next:" on its
+    first frame), with `wait` seconds as an upper bound. Uses SIGINT (not
+    SIGTERM) so the KeyboardInterrupt handler fires and the summary is
+    printed before the process exits. The child gets its own process group,
+    so a Ctrl+C at the test runner doesn't reach it and our SIGINT reaches
+    only it. (Sound players run in sessions of their own; -q spawns none.)
     """
     proc = subprocess.Popen(
         [sys.executable, SCRIPT] + args,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
+        env=CHILD_ENV,
+        start_new_session=True,
     )
-    time.sleep(wait)
-    proc.send_signal(signal.SIGINT)
-    out, err = proc.communicate(timeout=timeout)
-    return out.decode(), err.decode(), proc.returncode
-
-
-def run_to_completion(args, timeout=10):
+    head = bytearray()
+    fd = proc.stdout.fileno()
+    deadline = time.monotonic() + wait
+    with selectors.DefaultSelector() as sel:
+        sel.register(fd, selectors.EVENT_READ)
+        while until not in head:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not sel.select(remaining):
+                break
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            head += chunk
+    os.killpg(proc.pid, signal.SIGINT)
+    out, err = _communicate(proc, timeout)
+    return (head + out).decode(), err.decode(), proc.returncode
+
+
+def run_to_completion(args, timeout=10, env=CHILD_ENV):
     """Run ding-timer and wait for it to exit on its own (auto-stop modes)."""
     proc = subprocess.Popen(
         [sys.executable, SCRIPT] + args,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
+        env=env,
+        start_new_session=True,
     )
-    out, err = proc.communicate(timeout=timeout)
+    out, err = _communicate(proc, timeout)
     return out.decode(), err.decode(), proc.returncode
 
 
+def _communicate(proc, timeout):
+    """proc.communicate(), but a hung child is killed and reaped before raising."""
+    try:
+        return proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _terminate(proc)
+        raise
+
+
+def _terminate(proc):
+    """SIGKILL the child's process group, then reap it and close its pipes."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    proc.communicate()
+
+
+def header(interval, cs=None, task=None, duration=None):
+    """Session header as print_header would write it, without a subprocess."""
+    return DING.render_header(interval, task, duration, DING.SCHEMES[cs], cs)
+
+
+def frame(elapsed, interval=5, cs=None, duration=None, max_dings=None, reverse=False):
+    """One display line as run_stopwatch would draw it `elapsed` seconds in."""
+    s = DING.SCHEMES[cs]
+    render = DING.make_render_line(
+        interval, duration, reverse or bool(duration), max_dings, s, cs,
+        tenths=DING.render_period(interval, duration, s["bar_width"]) < 1.0,
+    )
+    return render(elapsed, int(elapsed // interval), 0.0)
+
+
+SESSION_LIMIT = 100_000
+
+
+def session(interval, stop_after=None, overshoot=0.0, stall=None, **kwargs):
+    """Run run_stopwatch in-process against a fake clock; return (stdout, stderr).
+
+    Each sleep advances the clock by exactly the requested time, so auto-stop
+    sessions finish instantly. With stop_after=N the (N+1)th sleep raises
+    KeyboardInterrupt, as Ctrl+C would. overshoot is added to every sleep,
+    like a real timer waking late. stall=(at, seconds) makes the first sleep
+    that reaches `at` oversleep by `seconds`, like a suspended laptop. The
+    session log goes to a temp file.
+    A loop that stops sleeping or never ends fails after SESSION_LIMIT clock
+    reads instead of hanging the suite.
+    """
+    now = 0.0
+    reads = 0
+    sleeps = 0
+
+    def clock():
+        nonlocal reads
+        reads += 1
+        if reads > SESSION_LIMIT:
+            raise AssertionError(f"session still running after {reads - 1} clock reads")
+        return now
+
+    def sleep(seconds):
+        nonlocal now, sleeps, stall
+        sleeps += 1
+        if stop_after is not None and sleeps > stop_after:
+            raise KeyboardInterrupt
+        now += seconds + overshoot
+        if stall and now >= stall[0]:
+            now += stall[1]
+            stall = None
+
+    out, err = io.StringIO(), io.StringIO()
+    with tempfile.TemporaryDirectory() as tmp, \
+            mock.patch.object(DING, "LOG_FILE", os.path.join(tmp, "log.csv")), \
+            contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        DING.run_stopwatch(interval, quiet=True, clock=clock, sleep=sleep, **kwargs)
+    return out.getvalue(), err.getvalue()
+
+
 class TestHeader(unittest.TestCase):
     def test_stopwatch_header_default(self):
-        out, _, _ = run(["5", "--quiet"])
+        out = header(5)
         self.assertIn("STOPWATCH", out)
         self.assertIn("Ding every 5s", out)
         self.assertIn("Ctrl+C to stop", out)
 
     def test_countdown_header_default(self):
-        out, _, _ = run(["5", "--duration", "30s", "--quiet"])
+        out = header(5, duration=30.0)
         self.assertIn("COUNTDOWN", out)
         self.assertIn("Duration:", out)
 
     def test_header_color_a(self):
-        out, _, _ = run(["5", "--color", "a", "--quiet"])
+        out = header(5, cs="a")
         self.assertIn("Ctrl+C to stop", out)
         self.assertIn("5s", out)
 
     def test_header_color_b(self):
-        out, _, _ = run(["5", "--color", "b", "--quiet"])
+        out = header(5, cs="b")
         self.assertIn("Interval: 5s", out)
         self.assertIn("Ctrl+C to stop", out)
 
     def test_header_color_c(self):
-        out, _, _ = run(["5", "--color", "c", "--quiet"])
+        out = header(5, cs="c")
         self.assertIn("┌", out)
         self.assertIn("┘", out)
         self.assertIn("Interval: 5s", out)
 
     def test_task_label_shown(self):
-        out, _, _ = run(["5", "--task", "Deep work", "--quiet"])
+        out = header(5, task="Deep work")
         self.assertIn("Deep work", out)
 
     def test_task_label_color_a(self):
-        out, _, _ = run(["5", "--color", "a", "--task", "My task", "--quiet"])
+        out = header(5, cs="a", task="My task")
         self.assertIn("My task", out)
 
+    def test_header_printed_by_script(self):
+        out, _, _ = run(["5", "--task", "Deep work", "--quiet"])
+        self.assertIn(header(5, task="Deep work"), out)
+
 
 class TestDisplayLine(unittest.TestCase):
     def test_clock_displayed(self):
-        out, _, _ = run(["5", "--quiet"])
+        out = frame(0.0)
         # Clock appears as [HH:MM]
         self.assertRegex(out, r"\[\d{2}:\d{2}\]")
 
     def test_progress_bar_shown(self):
-        out, _, _ = run(["5", "--quiet"])
+        out = frame(1.5)
         self.assertIn("█", out)
 
     def test_next_ding_indicator(self):
-        out, _, _ = run(["5", "--quiet"])
+        out = frame(0.0)
         self.assertIn("Next:", out)
 
     def test_countdown_shows_time_left(self):
-        out, _, _ = run(["5", "--duration", "30s", "--quiet"])
+        out = frame(0.0, duration=30.0)
         self.assertIn("left", out)
 
     def test_count_info_shown(self):
-        out, _, _ = run(["5", "--count", "3", "--quiet"])
+        out = frame(0.0, max_dings=3)
         self.assertIn("[0/3]", out)
 
+    def test_stopwatch_tenths(self):
+        self.assertIn("00:05.3", frame(5.3, interval=5))
+
+    def test_stopwatch_drops_tenths_for_long_intervals(self):
+        # Frames are a second apart from a 60s interval up, so .d would lag
+        out = frame(65.3, interval=60)
+        self.assertIn("01:05", out)
+        self.assertNotIn("01:05.", out)
+
+    def test_line_tail_clears_previous_frame(self):
+        # ANSI schemes erase to end of line; plain pads with spaces, no escapes
+        for cs in ("a", "b", "c"):
+            with self.subTest(cs=cs):
+                self.assertTrue(frame(0.0, cs=cs).endswith("\033[K"))
+        plain = frame(0.0)
+        self.assertTrue(plain.endswith("]   "))
+        self.assertNotIn("\033", plain)
+
     def test_reverse_bar_present(self):
         # --reverse should still show a bar
-        out, _, _ = run(["5", "--quiet", "--reverse"])
-        self.assertIn("░", out)  # empty bar chars should be visible at start
+        out = frame(1.5, reverse=True)
+        self.assertIn("░", out)  # drained cells should be visible early on
 
 
 class TestIntervals(unittest.TestCase):
     def test_float_interval(self):
-        out, _, _ = run(["1.5", "--quiet"])
+        out = header(1.5)
         self.assertIn("1.5s", out)
 
     def test_float_interval_below_one(self):
-        out, _, _ = run(["0.5", "--quiet"])
+        out = header(0.5)
         self.assertIn("0.5s", out)
 
     def test_integer_interval_no_decimal(self):
-        out, _, _ = run(["30", "--quiet"])
+        out = header(30.0)
         self.assertIn("30s", out)
         self.assertNotIn("30.0s", out)
 
@@ -131,44 +272,84 @@ class TestAutoStop(unittest.TestCase):
         self.assertEqual(err, "")
 
     def test_duration_stops_after_time(self):
-        out, err, rc = run_to_completion(["2", "--duration", "3s", "--quiet"])
+        out, err = session(2.0, duration=3.0)
         self.assertIn("Session complete", out)
         self.assertEqual(err, "")
 
     def test_duration_summary_shows_countdown_header(self):
-        out, _, _ = run_to_completion(["2", "--duration", "3s", "--quiet"])
+        out, _ = session(2.0, duration=3.0)
         self.assertIn("COUNTDOWN", out)
 
+    def test_countdown_shows_every_second_at_one_fps(self):
+        # 1 fps countdown with sleeps waking 0.5ms late: 24:59 used to be skipped
+        out, _ = session(60.0, duration=1500.0, overshoot=0.0005)
+        shown = [int(m) * 60 + int(sec) for m, sec in re.findall(r"(\d+):(\d\d) left", out)]
+        self.assertEqual(shown[0], 1500)
+        self.assertEqual(sorted(set(shown), reverse=True), list(range(1500, shown[-1] - 1, -1)))
+
+    def test_stall_coalesces_overdue_dings(self):
+        # Asleep from ~8.5s to ~120.5s: dings 9..120 collapse into one, which
+        # plays the best milestone in the range (100).
+        with mock.patch.object(DING, "play_ding") as play:
+            out, _ = session(1.0, milestones=True, max_dings=120, stall=(8.5, 112.0))
+        levels = [c.args[0] for c in play.call_args_list]
+        self.assertEqual(levels, [0] * 8 + [100, -1])
+        self.assertIn("Total dings: 120", out)
+        self.assertIn("(111 overdue dings were coalesced)", out)
+
+    def test_fractional_interval_counts_every_ding(self):
+        # k * 0.1 // 0.1 can come out as k - 1; each boundary must still count once
+        out, _ = session(0.1, max_dings=12)
+        self.assertIn("Session complete", out)
+        self.assertIn("Total dings: 12", out)
+        self.assertNotIn("overdue", out)
+
+    def test_long_countdown_finishes(self):
+        out, _ = session(2.0, duration=10.0)
+        self.assertIn("Session complete", out)
+        self.assertIn("Total dings: 4", out)  # the 10s boundary is the end ding
+        self.assertNotIn("overdue", out)
+
+    def test_long_stopwatch_keeps_waiting(self):
+        # 60 frames of 0.1s pass 4.3s, where int(now / period) + 1 == now
+        out, _ = session(5.0, stop_after=60)
+        self.assertIn("Total dings: 1", out)
+        self.assertNotIn("overdue", out)
+
 
 class TestSummary(unittest.TestCase):
     def test_summary_shows_final_time(self):
-        out, _, _ = run(["5", "--quiet"], wait=1.5)
+        out, _ = session(5.0, stop_after=3)
         # Interrupt → summary with "Final time:"
         self.assertIn("Final time:", out)
 
     def test_summary_shows_dings(self):
-        out, _, _ = run(["5", "--quiet"], wait=1.5)
+        out, _ = session(5.0, stop_after=3)
         self.assertIn("Total dings:", out)
 
     def test_summary_color_b(self):
-        out, _, _ = run(["5", "--color", "b", "--quiet"], wait=1.5)
+        out, _ = session(5.0, color_scheme="b", stop_after=3)
         self.assertIn("Final:", out)
         self.assertIn("dings", out)
 
     def test_summary_color_c(self):
-        out, _, _ = run(["5", "--color", "c", "--quiet"], wait=1.5)
+        out, _ = session(5.0, color_scheme="c", stop_after=3)
         self.assertIn("┌", out)
         self.assertIn("Time:", out)
         self.assertIn("Dings:", out)
 
     def test_summary_completion_message(self):
-        out, _, _ = run_to_completion(["1", "--count", "1", "--quiet"])
+        out, _ = session(1.0, max_dings=1)
         self.assertIn("Session complete", out)
 
     def test_summary_average_shown_when_dings_occurred(self):
-        out, _, _ = run_to_completion(["1", "--count", "2", "--quiet"])
+        out, _ = session(1.0, max_dings=2)
         self.assertIn("Average", out)
 
+    def test_summary_after_interrupt_in_script(self):
+        out, _, _ = run(["5", "--quiet"])
+        self.assertIn("Final time:", out)
+
 
 class TestQuiet(unittest.TestCase):
     def test_quiet_no_stderr(self):
@@ -181,195 +362,220 @@ class TestQuiet(unittest.TestCase):
 
 
 class TestValidation(unittest.TestCase):
-    def test_negative_interval_rejected(self):
-        proc = subprocess.Popen(
-            [sys.executable, SCRIPT, "-5"],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-        )
-        _, err = proc.communicate()
-        self.assertEqual(proc.returncode, 1)
-        self.assertIn("Error", err.decode())
-
-    def test_zero_interval_rejected(self):
-        proc = subprocess.Popen(
-            [sys.executable, SCRIPT, "0"],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-        )
-        _, err = proc.communicate()
-        self.assertEqual(proc.returncode, 1)
-
-    def test_invalid_duration_rejected(self):
-        proc = subprocess.Popen(
-            [sys.executable, SCRIPT, "5", "--duration", "notatime"],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-        )
-        _, err = proc.communicate()
-        self.assertEqual(proc.returncode, 1)
-        self.assertIn("Error", err.decode())
-
-    def test_negative_duration_rejected(self):
-        # argparse may exit with code 2 (unknown flag) or our code exits with 1;
-        # either way it must not succeed (returncode 0)
-        proc = subprocess.Popen(
-            [sys.executable, SCRIPT, "5", "--duration", "-5m"],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-        )
-        _, err = proc.communicate()
-        self.assertNotEqual(proc.returncode, 0)
+    # (args, expected return code, "Error" expected on stderr). A negative
+    # duration may be rejected by argparse (exit 2, unknown flag) or by us
+    # (exit 1); either way it must not succeed, hence None: "any non-zero".
+    REJECTED = [
+        (["-5"], 1, True),
+        (["0"], 1, False),
+        (["5", "--duration", "notatime"], 1, True),
+        (["5", "--duration", "-5m"], None, False),
+    ]
+
+    def test_bad_arguments_rejected(self):
+        # Start every case before waiting on any, so interpreter startups overlap
+        procs = []
+        try:
+            for args, _, _ in self.REJECTED:
+                procs.append(subprocess.Popen(
+                    [sys.executable, SCRIPT] + args,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    env=CHILD_ENV, start_new_session=True,
+                ))
+            for proc, (args, rc, error) in zip(procs, self.REJECTED):
+                with self.subTest(args=args):
+                    _, err = _communicate(proc, 10)
+                    if rc is None:
+                        self.assertNotEqual(proc.returncode, 0)
+                    else:
+                        self.assertEqual(proc.returncode, rc)
+                    if error:
+                        self.assertIn("Error", err.decode())
+        finally:
+            # A timeout (or failed spawn) must not leave the other cases running
+            for proc in procs:
+                if proc.returncode is None:
+                    _terminate(proc)
 
 
 class TestDurationParsing(unittest.TestCase):
     """Unit tests for parse_duration() directly."""
 
-    def setUp(self):
-        # Import the module directly
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("ding_timer", SCRIPT)
-        self.mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(self.mod)
-
     def test_minutes(self):
-        self.assertEqual(self.mod.parse_duration("25m"), 1500.0)
+        self.assertEqual(DING.parse_duration("25m"), 1500.0)
 
     def test_seconds(self):
-        self.assertEqual(self.mod.parse_duration("90s"), 90.0)
+        self.assertEqual(DING.parse_duration("90s"), 90.0)
 
     def test_hours(self):
-        self.assertEqual(self.mod.parse_duration("1h"), 3600.0)
+        self.assertEqual(DING.parse_duration("1h"), 3600.0)
 
     def test_raw_seconds(self):
-        self.assertEqual(self.mod.parse_duration("1500"), 1500.0)
+        self.assertEqual(DING.parse_duration("1500"), 1500.0)
 
     def test_float_minutes(self):
-        self.assertAlmostEqual(self.mod.parse_duration("1.5m"), 90.0)
+        self.assertAlmostEqual(DING.parse_duration("1.5m"), 90.0)
 
     def test_uppercase_ignored(self):
-        self.assertEqual(self.mod.parse_duration("25M"), 1500.0)
+        self.assertEqual(DING.parse_duration("25M"), 1500.0)
 
     def test_invalid_raises(self):
         with self.assertRaises(ValueError):
-            self.mod.parse_duration("abc")
+            DING.parse_duration("abc")
 
 
 class TestFormatters(unittest.TestCase):
-    def setUp(self):
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("ding_timer", SCRIPT)
-        self.mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(self.mod)
-
-    def test_format_elapsed_under_minute(self):
-        self.assertEqual(self.mod.format_elapsed(5.7), "00:05.7")
-
-    def test_format_elapsed_minutes(self):
-        self.assertEqual(self.mod.format_elapsed(90.0), "01:30.0")
-
-    def test_format_elapsed_hours(self):
-        self.assertEqual(self.mod.format_elapsed(3661.0), "01:01:01.0")
-
-    def test_format_remaining_under_minute(self):
-        self.assertEqual(self.mod.format_remaining(45.9), "00:45")
-
-    def test_format_remaining_minutes(self):
-        self.assertEqual(self.mod.format_remaining(1500), "25:00")
-
-    def test_format_remaining_hours(self):
-        self.assertEqual(self.mod.format_remaining(3661), "1:01:01")
-
-    def test_format_remaining_zero(self):
-        self.assertEqual(self.mod.format_remaining(0), "00:00")
-
-    def test_format_remaining_negative_clamped(self):
-        self.assertEqual(self.mod.format_remaining(-5), "00:00")
+    ELAPSED = [
+        (5.7, True, "00:05.7"),
+        (90.0, True, "01:30.0"),
+        (3661.0, True, "01:01:01.0"),
+        (3661.9, False, "01:01:01"),
+        (90.9, False, "01:30"),
+    ]
+    REMAINING = [
+        (45.9, "00:45"),
+        (1500, "25:00"),
+        (3661, "1:01:01"),
+        (0, "00:00"),
+        (-5, "00:00"),  # negative clamped
+    ]
+
+    def test_format_elapsed(self):
+        for seconds, tenths, expected in self.ELAPSED:
+            with self.subTest(seconds=seconds, tenths=tenths):
+                self.assertEqual(DING.format_elapsed(seconds, tenths=tenths), expected)
+
+    def test_format_remaining(self):
+        for seconds, expected in self.REMAINING:
+            with self.subTest(seconds=seconds):
+                self.assertEqual(DING.format_remaining(seconds), expected)
 
 
 class TestBuildBar(unittest.TestCase):
-    def setUp(self):
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("ding_timer", SCRIPT)
-        self.mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(self.mod)
-        self.s_plain = self.mod.SCHEMES[None]
-        self.s_colored = self.mod.SCHEMES["a"]
-
-    def test_empty_bar_at_zero(self):
-        bar = self.mod.build_bar(self.s_plain, 0.0)
-        self.assertEqual(bar, "░" * 24)
-
-    def test_full_bar_at_one(self):
-        bar = self.mod.build_bar(self.s_plain, 1.0)
-        self.assertEqual(bar, "█" * 24)
-
-    def test_half_bar(self):
-        bar = self.mod.build_bar(self.s_plain, 0.5)
-        self.assertEqual(bar.count("█"), 12)
-        self.assertEqual(bar.count("░"), 12)
-
-    def test_reverse_empty_bar_at_one(self):
-        bar = self.mod.build_bar(self.s_plain, 1.0, reverse=True)
-        self.assertEqual(bar, "░" * 24)
-
-    def test_reverse_full_bar_at_zero(self):
-        bar = self.mod.build_bar(self.s_plain, 0.0, reverse=True)
-        self.assertEqual(bar, "█" * 24)
-
-    def test_reverse_half(self):
-        bar = self.mod.build_bar(self.s_plain, 0.5, reverse=True)
-        self.assertEqual(bar.count("█"), 12)
-        self.assertEqual(bar.count("░"), 12)
+    # (progress, reverse, filled cells) on the plain 24-cell bar;
+    # progress outside [0, 1] is clamped.
+    PLAIN = [
+        (0.0, False, 0),
+        (1.0, False, 24),
+        (0.5, False, 12),
+        (1.0, True, 0),
+        (0.0, True, 24),
+        (0.5, True, 12),
+        (1.5, False, 24),
+        (-0.5, False, 0),
+    ]
 
-    def test_progress_clamped_above_one(self):
-        bar = self.mod.build_bar(self.s_plain, 1.5)
-        self.assertEqual(bar, "█" * 24)
+    def setUp(self):
+        self.s_plain = DING.SCHEMES[None]
+        self.s_colored = DING.SCHEMES["a"]
 
-    def test_progress_clamped_below_zero(self):
-        bar = self.mod.build_bar(self.s_plain, -0.5)
-        self.assertEqual(bar, "░" * 24)
+    def test_plain_bar(self):
+        for progress, reverse, filled in self.PLAIN:
+            with self.subTest(progress=progress, reverse=reverse):
+                bar = DING.build_bar(self.s_plain, progress, reverse=reverse)
+                self.assertEqual(bar, "█" * filled + "░" * (24 - filled))
 
     def test_colored_bar_contains_reset(self):
-        bar = self.mod.build_bar(self.s_colored, 0.5)
+        bar = DING.build_bar(self.s_colored, 0.5)
         self.assertIn("\033[0m", bar)
 
     def test_colored_gradient_green_at_low_progress(self):
         # progress=0.5 → display=0.5 → > 0.3 threshold → green
-        bar = self.mod.build_bar(self.s_colored, 0.5, reverse=False)
+        bar = DING.build_bar(self.s_colored, 0.5, reverse=False)
         self.assertIn("\033[92m", bar)  # green
 
     def test_colored_gradient_coral_near_full(self):
         # Very high display (> 90%) → green, and very low (< 10%) → coral
         # Reverse at 0.95 progress → display 0.05 → coral
-        bar = self.mod.build_bar(self.s_colored, 0.95, reverse=True)
+        bar = DING.build_bar(self.s_colored, 0.95, reverse=True)
         self.assertIn("\033[38;5;210m", bar)  # coral
 
 
+class TestRenderPeriod(unittest.TestCase):
+    # (interval, duration, seconds between frames) on the 24-cell plain bar
+    PERIODS = [
+        (5, None, 0.1),  # stopwatch shows tenths
+        (59.9, None, 0.1),
+        (60, None, 1.0),  # tenths dropped from a minute up
+        (300, None, 1.0),
+        (1, 1500, 0.1),  # countdown bands: < 5s, < 60s, the rest
+        (10, 1500, 0.5),
+        (60, 1500, 1.0),
+        (60, 12, 0.5),  # capped at duration / bar_width ...
+        (10, 6, 0.25),
+        (60, 1.2, 0.1),  # ... but never below 0.1
+    ]
+
+    def test_render_period(self):
+        bar_width = DING.SCHEMES[None]["bar_width"]
+        for interval, duration, expected in self.PERIODS:
+            with self.subTest(interval=interval, duration=duration):
+                self.assertAlmostEqual(
+                    DING.render_period(interval, duration, bar_width), expected
+                )
+
+
+class TestMilestones(unittest.TestCase):
+    def test_single_ding_on_milestone(self):
+        self.assertEqual(DING.highest_milestone(10, 10), 10)
+
+    def test_single_ding_off_milestone(self):
+        self.assertEqual(DING.highest_milestone(11, 11), 0)
+
+    def test_coalesced_range_keeps_highest(self):
+        self.assertEqual(DING.highest_milestone(8, 120), 100)
+
+
+class TestOutput(unittest.TestCase):
+    def test_short_writes_are_retried(self):
+        # A busy tty/pipe may accept only part of a frame per write(2)
+        r, w = os.pipe()
+        real_write = os.write
+        try:
+            with mock.patch.object(
+                DING.os, "write", side_effect=lambda fd, data: real_write(fd, data[:3])
+            ):
+                DING._write_all(w, "┃ 00:05.3 ┃".encode())
+            os.close(w)
+            self.assertEqual(os.read(r, 100).decode(), "┃ 00:05.3 ┃")
+        finally:
+            os.close(r)
+
+
 class TestSessionLog(unittest.TestCase):
     def test_log_written_on_auto_stop(self):
-        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
-            log_path = f.name
-
-        try:
-            env = os.environ.copy()
-            # Patch LOG_FILE via env isn't possible directly; use count=1 short run
-            # and check the actual log file
+        # A private log file keeps the real ~/.ding-log.csv out of it and
+        # lets parallel runs each check their own.
+        with tempfile.TemporaryDirectory() as tmp:
+            log = os.path.join(tmp, "log.csv")
+            env = dict(CHILD_ENV, DING_LOG_FILE=log)
             run_to_completion(
-                ["1", "--count", "1", "--quiet", "--task", "log-test-session"]
+                ["1", "--count", "1", "--quiet", "--task", "log-test-session"],
+                env=env,
             )
-            log = os.path.expanduser("~/.ding-log.csv")
             self.assertTrue(os.path.exists(log))
-            with open(log) as f:
+            with open(log, newline="") as f:
                 content = f.read()
-            self.assertIn("log-test-session", content)
-            # Check CSV structure
-            with open(log) as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-            self.assertIn("date", rows[0])
-            self.assertIn("task", rows[0])
-            self.assertIn("elapsed_seconds", rows[0])
-            self.assertIn("dings", rows[0])
-            self.assertIn("interval_seconds", rows[0])
-        finally:
-            os.unlink(log_path)
+        self.assertIn("log-test-session", content)
+        # Check CSV structure
+        rows = list(csv.DictReader(io.StringIO(content)))
+        self.assertIn("date", rows[0])
+        self.assertIn("task", rows[0])
+        self.assertIn("elapsed_seconds", rows[0])
+        self.assertIn("dings", rows[0])
+        self.assertIn("interval_seconds", rows[0])
+
+    def test_header_written_once_when_appending(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log = os.path.join(tmp, "log.csv")
+            with mock.patch.object(DING, "LOG_FILE", log):
+                DING.save_log("first", 12.3, 2, 5.0)
+                DING.save_log("second", 4.0, 0, 5.0)
+            with open(log, newline="") as f:
+                rows = list(csv.reader(f))
+        self.assertEqual(rows[0], DING.LOG_HEADER)
+        self.assertEqual([r[1] for r in rows[1:]], ["first", "second"])
+        self.assertEqual(rows.count(DING.LOG_HEADER), 1)
 
     def test_log_not_required_to_run(self):
         # Even if log write would fail, the app should not crash
@@ -384,8 +590,8 @@ class TestSyntax(unittest.TestCase):
         py_compile.compile(SCRIPT, doraise=True)
 
     def test_no_unused_stdlib_side_effects(self):
-        # Importing the module should not start any threads or open files
-        import importlib.util
+        # Importing the module should not start any threads or open files.
+        # Deliberately a fresh load rather than the shared DING.
         spec = importlib.util.spec_from_file_location("ding_timer", SCRIPT)
         mod = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(mod)
@@ -400,4 +606,6 @@ class TestSyntax(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main(verbosity=2)
+    # One dot per test (-v for names); buffer=True holds each test's output
+    # in memory and only shows it for failures.
+    unittest.main(buffer=True)